@@ -4,6 +4,8 @@ This file provides convenient methods that wrap the Nutrient Build API
 for supported document processing operations.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 
 from nutrient_dws.file_handler import FileInput
@@ -12,6 +14,10 @@ if TYPE_CHECKING:
     from nutrient_dws.builder import BuildAPIWrapper
     from nutrient_dws.http_client import HTTPClient
 
+# Concurrent page range requests in split_pdf. requests builds each upload
+# body in memory, so peak memory grows with this number times the input size.
+SPLIT_PDF_MAX_WORKERS = 4
+
 
 class HasBuildMethod(Protocol):
     """Protocol for objects that have a build method."""
@@ -279,7 +285,11 @@ class DirectAPIMixin:
                 output_paths=["part1.pdf", "part2.pdf"]
             )
         """
-        from nutrient_dws.file_handler import prepare_file_for_upload, save_file_output
+        from nutrient_dws.file_handler import (
+            prepare_file_for_upload,
+            prepare_file_input,
+            save_file_output,
+        )
 
         # Validate inputs
         if output_paths and page_ranges and len(output_paths) != len(page_ranges):
@@ -290,30 +300,46 @@ class DirectAPIMixin:
             # We'll need to determine page count first - for now, assume single page split
             page_ranges = [{"start": 0, "end": 1}]
 
-        results = []
-
-        # Process each page range as a separate API call
-        for i, page_range in enumerate(page_ranges):
-            # Prepare file for upload
-            file_field, file_data = prepare_file_for_upload(input_file, "file")
-            files = {file_field: file_data}
+        # File-like inputs can only be read once, so read them up front and
+        # upload the same bytes for every range
+        upload_name = None
+        if not isinstance(input_file, str | Path | bytes):
+            input_file, upload_name = prepare_file_input(input_file)
+
+        def extract_pages(page_range: dict[str, int]) -> bytes:
+            # Prepare the upload per request so at most one large-file handle
+            # per worker is open at a time
+            file_field, (filename, content, content_type) = prepare_file_for_upload(
+                input_file, "file"
+            )
+            try:
+                files = {file_field: (upload_name or filename, content, content_type)}
 
-            # Build instructions for page extraction
-            instructions = {"parts": [{"file": "file", "pages": page_range}], "actions": []}
+                # Build instructions for page extraction
+                instructions = {"parts": [{"file": "file", "pages": page_range}], "actions": []}
 
-            # Make API request
-            # Type checking: at runtime, self is NutrientClient which has _http_client
-            result = self._http_client.post(  # type: ignore[attr-defined]
-                "/build",
-                files=files,
-                json_data=instructions,
-            )
+                # Type checking: at runtime, self is NutrientClient which has _http_client
+                return self._http_client.post(  # type: ignore[attr-defined, no-any-return]
+                    "/build",
+                    files=files,
+                    json_data=instructions,
+                )
+            finally:
+                # Large path inputs are opened as file handles; release them
+                # as soon as the request is done
+                if not isinstance(content, bytes):
+                    content.close()
+
+        # Each page range is a separate API call; send a few concurrently
+        with ThreadPoolExecutor(
+            max_workers=min(len(page_ranges), SPLIT_PDF_MAX_WORKERS)
+        ) as executor:
+            results = list(executor.map(extract_pages, page_ranges))
 
-            # Handle output
-            if output_paths and i < len(output_paths):
-                save_file_output(result, output_paths[i])
-            else:
-                results.append(result)  # type: ignore[arg-type]
+        # Handle output
+        if output_paths:
+            for result, output_path in zip(results, output_paths, strict=False):
+                save_file_output(result, output_path)
 
         return results if not output_paths else []
 
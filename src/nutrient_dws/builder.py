@@ -4,6 +4,27 @@ from typing import Any
 
 from nutrient_dws.file_handler import FileInput, prepare_file_for_upload, save_file_output
 
+# Map tool names to Build API action types
+TOOL_ACTION_TYPES = {
+    "rotate-pages": "rotate",
+    "ocr-pdf": "ocr",
+    "watermark-pdf": "watermark",
+    "flatten-annotations": "flatten",
+    "apply-instant-json": "applyInstantJson",
+    "apply-xfdf": "applyXfdf",
+    "create-redactions": "createRedactions",
+    "apply-redactions": "applyRedactions",
+}
+
+# Map common OCR language codes to API format
+OCR_LANGUAGES = {
+    "en": "english",
+    "de": "deu",
+    "eng": "eng",
+    "deu": "deu",
+    "german": "deu",
+}
+
 
 class BuildAPIWrapper:
     r"""Builder pattern implementation for chaining document operations.
@@ -165,19 +186,7 @@ class BuildAPIWrapper:
         Returns:
             Action dictionary for the Build API.
         """
-        # Map tool names to action types
-        tool_mapping = {
-            "rotate-pages": "rotate",
-            "ocr-pdf": "ocr",
-            "watermark-pdf": "watermark",
-            "flatten-annotations": "flatten",
-            "apply-instant-json": "applyInstantJson",
-            "apply-xfdf": "applyXfdf",
-            "create-redactions": "createRedactions",
-            "apply-redactions": "applyRedactions",
-        }
-
-        action_type = tool_mapping.get(tool, tool)
+        action_type = TOOL_ACTION_TYPES.get(tool, tool)
 
         # Build action dictionary
         action = {"type": action_type}
@@ -192,15 +201,8 @@ class BuildAPIWrapper:
             case "ocr":
                 if "language" in options:
                     # Map common language codes to API format
-                    lang_map = {
-                        "en": "english",
-                        "de": "deu",
-                        "eng": "eng",
-                        "deu": "deu",
-                        "german": "deu",
-                    }
                     lang = options["language"]
-                    action["language"] = lang_map.get(lang, lang)
+                    action["language"] = OCR_LANGUAGES.get(lang, lang)
 
             case "watermark":
                 # Watermark requires width/height
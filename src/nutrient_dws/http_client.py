@@ -2,7 +2,11 @@
 
 import json
 import logging
-from typing import Any
+import random
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, BinaryIO, NoReturn, overload
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -14,9 +18,78 @@ from nutrient_dws.exceptions import (
     NutrientTimeoutError,
     ValidationError,
 )
+from nutrient_dws.file_handler import DEFAULT_CHUNK_SIZE
+
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+try:
+    _PACKAGE_VERSION = version("nutrient-dws")
+except PackageNotFoundError:  # pragma: no cover - running from an uninstalled checkout
+    _PACKAGE_VERSION = "unknown"
+
+# Resolved once at import instead of per session
+USER_AGENT = f"nutrient-dws-python-client/{_PACKAGE_VERSION}"
+
+# Connection pool size, also the upper bound for concurrent requests
+POOL_SIZE = 32
+
+# Upper bound in seconds for a single retry backoff
+RETRY_BACKOFF_MAX = 30.0
+# Random extra backoff as a fraction of the exponential delay
+RETRY_JITTER = 0.5
+
+
+class BackoffRetry(Retry):
+    """Retry policy with capped exponential backoff and random jitter.
+
+    Jitter spreads out retries from clients that hit the same transient
+    error, and the cap keeps later attempts from waiting too long.
+    """
+
+    def get_backoff_time(self) -> float:
+        """Exponential backoff scaled by up to ``1 + RETRY_JITTER``, capped."""
+        backoff = super().get_backoff_time()
+        return min(RETRY_BACKOFF_MAX, backoff * (1 + random.uniform(0, RETRY_JITTER)))
+
+
+def _raise_authentication_error(
+    response: requests.Response, message: str, details: Any
+) -> NoReturn:
+    """Raise AuthenticationError for a 401/403 response."""
+    raise AuthenticationError(message or "Authentication failed. Check your API key.") from None
+
+
+def _raise_validation_error(response: requests.Response, message: str, details: Any) -> NoReturn:
+    """Raise ValidationError for a 422 response."""
+    raise ValidationError(message or "Request validation failed", errors=details) from None
+
+
+def _raise_api_error(response: requests.Response, message: str, details: Any) -> NoReturn:
+    """Raise APIError for any other error response."""
+    raise APIError(
+        message,
+        status_code=response.status_code,
+        response_body=response.text,
+        # Extract request ID if available
+        request_id=response.headers.get("X-Request-Id"),
+    ) from None
+
+
+# Error raisers for status codes with a dedicated exception type; any other
+# error status falls back to _raise_api_error
+_ERROR_HANDLERS: dict[int, Callable[[requests.Response, str, Any], NoReturn]] = {
+    401: _raise_authentication_error,
+    403: _raise_authentication_error,
+    422: _raise_validation_error,
+}
+
 
 class HTTPClient:
     """HTTP client with connection pooling and retry logic."""
@@ -37,26 +110,28 @@ class HTTPClient:
         """Create requests session with retry logic."""
         session = requests.Session()
 
-        # Configure retries with exponential backoff
-        retry_strategy = Retry(
+        # Configure retries with exponential backoff. Connection errors and
+        # timeouts are retried; client errors other than 408/429 are not.
+        retry_strategy = BackoffRetry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[408, 429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
             raise_on_status=False,  # We'll handle status codes ourselves
         )
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=10,
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            # Wait for a pooled connection rather than opening (and then
+            # discarding) extra ones with a fresh TLS handshake
+            pool_block=True,
         )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         # Set default headers
-        headers = {
-            "User-Agent": "nutrient-dws-python-client/0.1.0",
-        }
+        headers = {"User-Agent": USER_AGENT}
         if self._api_key:
             headers["Authorization"] = f"Bearer {self._api_key}"
 
@@ -64,23 +139,23 @@ class HTTPClient:
 
         return session
 
-    def _handle_response(self, response: requests.Response) -> bytes:
+    def _handle_response(
+        self, response: requests.Response, output: BinaryIO | None = None
+    ) -> bytes | None:
         """Handle API response and raise appropriate exceptions.
 
         Args:
-            response: Response from the API.
+            response: Streamed response from the API.
+            output: Binary file-like object to write the content to.
 
         Returns:
-            Response content as bytes.
+            Response content as bytes, or None if written to ``output``.
 
         Raises:
             AuthenticationError: For 401/403 responses.
             ValidationError: For 422 responses.
             APIError: For other error responses.
         """
-        # Extract request ID if available
-        request_id = response.headers.get("X-Request-Id")
-
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError:
@@ -89,33 +164,47 @@ class HTTPClient:
             error_details = None
 
             try:
-                error_data = response.json()
+                error_data = _json_loads(response.content)
                 error_message = error_data.get("message", error_message)
                 error_details = error_data.get("errors", error_data.get("details"))
-            except (json.JSONDecodeError, requests.exceptions.JSONDecodeError):
+            except ValueError:  # Raised by both json and orjson decode errors
                 # If response is not JSON, use text content
                 if response.text:
                     error_message = f"{error_message}: {response.text[:200]}"
 
             # Handle specific status codes
-            if response.status_code in (401, 403):
-                raise AuthenticationError(
-                    error_message or "Authentication failed. Check your API key."
-                ) from None
-            elif response.status_code == 422:
-                raise ValidationError(
-                    error_message or "Request validation failed",
-                    errors=error_details,
-                ) from None
-            else:
-                raise APIError(
-                    error_message,
-                    status_code=response.status_code,
-                    response_body=response.text,
-                    request_id=request_id,
-                ) from None
-
-        return response.content
+            handler = _ERROR_HANDLERS.get(response.status_code, _raise_api_error)
+            handler(response, error_message, error_details)
+
+        chunks = response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE)
+        if output is None:
+            return b"".join(chunks)
+
+        # Write chunks as they arrive so the full body is never held in memory
+        for chunk in chunks:
+            output.write(chunk)
+        return None
+
+    @overload
+    def post(
+        self,
+        endpoint: str,
+        files: dict[str, Any] | None = ...,
+        data: dict[str, Any] | None = ...,
+        json_data: dict[str, Any] | None = ...,
+        output: None = ...,
+    ) -> bytes: ...
+
+    @overload
+    def post(
+        self,
+        endpoint: str,
+        files: dict[str, Any] | None = ...,
+        data: dict[str, Any] | None = ...,
+        json_data: dict[str, Any] | None = ...,
+        *,
+        output: BinaryIO,
+    ) -> None: ...
 
     def post(
         self,
@@ -123,7 +212,8 @@ class HTTPClient:
         files: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
-    ) -> bytes:
+        output: BinaryIO | None = None,
+    ) -> bytes | None:
         """Make POST request to API.
 
         Args:
@@ -131,9 +221,11 @@ class HTTPClient:
             files: Files to upload.
             data: Form data.
             json_data: JSON data (for multipart requests).
+            output: Binary file-like object to stream the response into. If
+                the transfer fails midway, it is left partially written.
 
         Returns:
-            Response content as bytes.
+            Response content as bytes, or None if written to ``output``.
 
         Raises:
             AuthenticationError: If API key is missing or invalid.
@@ -149,7 +241,8 @@ class HTTPClient:
         # Prepare multipart data if json_data is provided
         prepared_data = data or {}
         if json_data is not None:
-            prepared_data["instructions"] = json.dumps(json_data)
+            # Compact separators drop the whitespace json.dumps adds by default
+            prepared_data["instructions"] = json.dumps(json_data, separators=(",", ":"))
 
         try:
             response = self._session.post(
@@ -157,7 +250,12 @@ class HTTPClient:
                 files=files,
                 data=prepared_data,
                 timeout=self._timeout,
+                stream=True,
             )
+            logger.debug(f"Response: {response.status_code}")
+            # The body is streamed, so reading it can still fail mid-transfer
+            with response:
+                return self._handle_response(response, output)
         except requests.exceptions.Timeout as e:
             raise NutrientTimeoutError(f"Request timed out after {self._timeout} seconds") from e
         except requests.exceptions.ConnectionError as e:
@@ -165,8 +263,35 @@ class HTTPClient:
         except requests.exceptions.RequestException as e:
             raise APIError(f"Request failed: {e!s}") from e
 
-        logger.debug(f"Response: {response.status_code}")
-        return self._handle_response(response)
+    def post_many(self, calls: Sequence[dict[str, Any]]) -> list[bytes]:
+        """Make several POST requests to the API concurrently.
+
+        Requests run on a thread pool sharing this client's session, so their
+        network round-trips overlap instead of running back to back.
+
+        Args:
+            calls: Keyword arguments for each ``post`` call
+                (``endpoint``, ``files``, ``data``, ``json_data``).
+                Streaming to ``output`` is not supported here.
+
+        Returns:
+            Response contents in the same order as ``calls``.
+
+        Raises:
+            ValueError: If a call passes ``output``.
+            AuthenticationError: If API key is missing or invalid.
+            TimeoutError: If a request times out.
+            APIError: For other API errors. The first failing request in
+                order is raised after all requests have finished.
+        """
+        if any("output" in kwargs for kwargs in calls):
+            raise ValueError("post_many does not support output; use post for streaming")
+
+        if len(calls) <= 1:
+            return [self.post(**kwargs) for kwargs in calls]
+
+        with ThreadPoolExecutor(max_workers=min(len(calls), POOL_SIZE)) as executor:
+            return list(executor.map(lambda kwargs: self.post(**kwargs), calls))
 
     def close(self) -> None:
         """Close the session."""
@@ -16,3 +16,12 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "integration" in str(item.fspath):
             item.add_marker(pytest.mark.integration)
+
+
+@pytest.fixture(scope="session")
+def out_dir(tmp_path_factory):
+    """Shared output directory for tests that write result files.
+
+    Tests should name files after ``request.node.name`` to keep them unique.
+    """
+    return tmp_path_factory.mktemp("live_api_out")
@@ -5,10 +5,16 @@ These tests require a valid API key configured in integration_config.py.
 
 from __future__ import annotations
 
+import os
+from typing import TYPE_CHECKING
+
 import pytest
 
 from nutrient_dws import NutrientClient
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 try:
     from . import integration_config  # type: ignore[attr-defined]
 
@@ -42,6 +48,33 @@ def assert_is_pdf(file_path_or_bytes: str | bytes) -> None:
         raise ValueError("Input must be file path string or bytes")
 
 
+def assert_pdf_result(
+    method: Callable[..., bytes | None],
+    input_file: str,
+    page_indexes: list[int],
+    output_path: str | None,
+) -> None:
+    """Call a page-index method and assert it produced a valid PDF.
+
+    Args:
+        method: Client method taking ``input_file``, ``page_indexes`` and ``output_path``.
+        input_file: Path to the input PDF.
+        page_indexes: Page indexes to pass to the method.
+        output_path: Optional path to save the output; bytes are checked when omitted.
+    """
+    result = method(input_file, page_indexes=page_indexes, output_path=output_path)
+
+    if output_path:
+        # Should return None when saving to file
+        assert result is None
+        assert os.path.getsize(output_path) > 0
+        assert_is_pdf(output_path)
+    else:
+        assert isinstance(result, bytes)
+        assert len(result) > 0
+        assert_is_pdf(result)
+
+
 @pytest.mark.skipif(not API_KEY, reason="No API key configured in integration_config.py")
 class TestLiveAPI:
     """Integration tests against live API."""
@@ -66,11 +99,13 @@ class TestLiveAPI:
         assert client._api_key == API_KEY
         client.close()
 
-    def test_client_missing_api_key(self):
+    def test_client_missing_api_key(self, monkeypatch):
         """Test that client works without API key but fails on API calls."""
+        monkeypatch.delenv("NUTRIENT_API_KEY", raising=False)
         client = NutrientClient()
         # Should not raise during initialization
         assert client is not None
+        assert client._api_key is None
         client.close()
 
     def test_basic_api_connectivity(self, client, sample_pdf_path):
@@ -81,10 +116,10 @@ class TestLiveAPI:
         assert builder is not None
 
     @pytest.mark.skip(reason="Requires specific tool implementation")
-    def test_convert_operation(self, client, sample_pdf_path, tmp_path):
+    def test_convert_operation(self, client, sample_pdf_path, out_dir, request):
         """Test a basic convert operation (example - adjust based on available tools)."""
         # This is an example - adjust based on actual available tools
-        # output_path = tmp_path / "output.pdf"
+        # output_path = out_dir / f"{request.node.name}.pdf"
         # result = client.convert_to_pdf(input_file=sample_pdf_path, output_path=str(output_path))
 
         # assert output_path.exists()
@@ -100,7 +135,7 @@ class TestLiveAPI:
 
         assert builder is not None
 
-    def test_split_pdf_integration(self, client, sample_pdf_path, tmp_path):
+    def test_split_pdf_integration(self, client, sample_pdf_path):
         """Test split_pdf method with live API."""
         # Test splitting PDF into two parts - sample PDF should have multiple pages
         page_ranges = [
@@ -120,9 +155,11 @@ class TestLiveAPI:
         for pdf_bytes in result:
             assert_is_pdf(pdf_bytes)
 
-    def test_split_pdf_with_output_files(self, client, sample_pdf_path, tmp_path):
+    def test_split_pdf_with_output_files(self, client, sample_pdf_path, out_dir, request):
         """Test split_pdf method saving to output files."""
-        output_paths = [str(tmp_path / "page1.pdf"), str(tmp_path / "remaining.pdf")]
+        page1_path = out_dir / f"{request.node.name}_page1.pdf"
+        remaining_path = out_dir / f"{request.node.name}_remaining.pdf"
+        output_paths = [str(page1_path), str(remaining_path)]
 
         page_ranges = [
             {"start": 0, "end": 1},  # First page
@@ -138,14 +175,14 @@ class TestLiveAPI:
         assert result == []
 
         # Check that output files were created
-        assert (tmp_path / "page1.pdf").exists()
-        assert (tmp_path / "page1.pdf").stat().st_size > 0
-        assert_is_pdf(str(tmp_path / "page1.pdf"))
+        assert page1_path.exists()
+        assert page1_path.stat().st_size > 0
+        assert_is_pdf(str(page1_path))
 
         # Second file should exist since sample PDF has multiple pages
-        assert (tmp_path / "remaining.pdf").exists()
-        assert (tmp_path / "remaining.pdf").stat().st_size > 0
-        assert_is_pdf(str(tmp_path / "remaining.pdf"))
+        assert remaining_path.exists()
+        assert remaining_path.stat().st_size > 0
+        assert_is_pdf(str(remaining_path))
 
     def test_split_pdf_single_page_default(self, client, sample_pdf_path):
         """Test split_pdf with default behavior (single page)."""
@@ -160,18 +197,18 @@ class TestLiveAPI:
         # Verify result is a valid PDF
         assert_is_pdf(result[0])
 
-    def test_set_page_label_integration(self, client, sample_pdf_path, tmp_path):
+    def test_set_page_label_integration(self, client, sample_pdf_path, out_dir, request):
         """Test set_page_label method with live API."""
         labels = [{"pages": {"start": 0, "end": 1}, "label": "Cover"}]
 
-        output_path = str(tmp_path / "labeled.pdf")
+        output_path = str(out_dir / f"{request.node.name}.pdf")
 
         # Try to set page labels
         result = client.set_page_label(sample_pdf_path, labels, output_path=output_path)
 
         # If successful, verify output
         assert result is None  # Should return None when output_path provided
-        assert (tmp_path / "labeled.pdf").exists()
+        assert os.path.exists(output_path)
         assert_is_pdf(output_path)
 
     def test_set_page_label_return_bytes(self, client, sample_pdf_path):
@@ -228,97 +265,52 @@ class TestLiveAPI:
         with pytest.raises(ValueError, match="'pages' must be a dict with 'start' key"):
             client.set_page_label(sample_pdf_path, labels=[{"pages": "invalid", "label": "test"}])
 
-    def test_duplicate_pdf_pages_basic(self, client, sample_pdf_path):
-        """Test duplicate_pdf_pages method with basic duplication."""
-        # Test duplicating first page twice
-        result = client.duplicate_pdf_pages(sample_pdf_path, page_indexes=[0, 0])
-
-        assert isinstance(result, bytes)
-        assert len(result) > 0
-
-        # Verify result is a valid PDF
-        assert_is_pdf(result)
-
-    def test_duplicate_pdf_pages_reorder(self, client, sample_pdf_path):
-        """Test duplicate_pdf_pages method with page reordering."""
-        # Test reordering pages (assumes sample PDF has at least 2 pages)
-        result = client.duplicate_pdf_pages(sample_pdf_path, page_indexes=[1, 0])
-
-        assert isinstance(result, bytes)
-        assert len(result) > 0
-
-        # Verify result is a valid PDF
-        assert_is_pdf(result)
-
-    def test_duplicate_pdf_pages_with_output_file(self, client, sample_pdf_path, tmp_path):
-        """Test duplicate_pdf_pages method saving to output file."""
-        output_path = str(tmp_path / "duplicated.pdf")
-
-        # Test duplicating and saving to file
-        result = client.duplicate_pdf_pages(
-            sample_pdf_path, page_indexes=[0, 0, 1], output_path=output_path
+    @pytest.mark.parametrize(
+        ("page_indexes", "use_output_file"),
+        [
+            ([0, 0], False),  # Duplicate first page twice
+            ([1, 0], False),  # Reorder pages
+            ([-1, 0, -1], False),  # Negative indexes (last page)
+            ([0, 0, 1], True),  # Save to output file
+        ],
+        ids=["basic", "reorder", "negative_indexes", "output_file"],
+    )
+    def test_duplicate_pdf_pages(
+        self, client, sample_pdf_path, out_dir, request, page_indexes, use_output_file
+    ):
+        """Test duplicate_pdf_pages method with various page index combinations."""
+        assert_pdf_result(
+            client.duplicate_pdf_pages,
+            sample_pdf_path,
+            page_indexes,
+            str(out_dir / f"{request.node.name}.pdf") if use_output_file else None,
         )
 
-        # Should return None when saving to file
-        assert result is None
-
-        # Check that output file was created
-        assert (tmp_path / "duplicated.pdf").exists()
-        assert (tmp_path / "duplicated.pdf").stat().st_size > 0
-        assert_is_pdf(output_path)
-
-    def test_duplicate_pdf_pages_negative_indexes(self, client, sample_pdf_path):
-        """Test duplicate_pdf_pages method with negative indexes."""
-        # Test using negative indexes (last page)
-        result = client.duplicate_pdf_pages(sample_pdf_path, page_indexes=[-1, 0, -1])
-
-        assert isinstance(result, bytes)
-        assert len(result) > 0
-
-        # Verify result is a valid PDF
-        assert_is_pdf(result)
-
     def test_duplicate_pdf_pages_empty_indexes_error(self, client, sample_pdf_path):
         """Test duplicate_pdf_pages method with empty page_indexes raises error."""
         with pytest.raises(ValueError, match="page_indexes cannot be empty"):
             client.duplicate_pdf_pages(sample_pdf_path, page_indexes=[])
 
-    def test_delete_pdf_pages_basic(self, client, sample_pdf_path):
-        """Test delete_pdf_pages method with basic page deletion."""
-        # Test deleting first page (assuming sample PDF has at least 2 pages)
-        result = client.delete_pdf_pages(sample_pdf_path, page_indexes=[0])
-
-        assert isinstance(result, bytes)
-        assert len(result) > 0
-
-        # Verify result is a valid PDF
-        assert_is_pdf(result)
-
-    def test_delete_pdf_pages_multiple(self, client, sample_pdf_path):
-        """Test delete_pdf_pages method with multiple page deletion."""
-        # Test deleting multiple pages
-        result = client.delete_pdf_pages(sample_pdf_path, page_indexes=[0, 2])
-
-        assert isinstance(result, bytes)
-        assert len(result) > 0
-
-        # Verify result is a valid PDF
-        assert_is_pdf(result)
-
-    def test_delete_pdf_pages_with_output_file(self, client, sample_pdf_path, tmp_path):
-        """Test delete_pdf_pages method saving to output file."""
-        output_path = str(tmp_path / "pages_deleted.pdf")
-
-        # Test deleting pages and saving to file
-        result = client.delete_pdf_pages(sample_pdf_path, page_indexes=[1], output_path=output_path)
-
-        # Should return None when saving to file
-        assert result is None
-
-        # Check that output file was created
-        assert (tmp_path / "pages_deleted.pdf").exists()
-        assert (tmp_path / "pages_deleted.pdf").stat().st_size > 0
-        assert_is_pdf(output_path)
+    @pytest.mark.parametrize(
+        ("page_indexes", "use_output_file"),
+        [
+            ([0], False),  # Delete first page
+            ([0, 2], False),  # Delete multiple pages
+            ([0, 0, 1], False),  # Duplicate indexes are de-duplicated
+            ([1], True),  # Save to output file
+        ],
+        ids=["basic", "multiple", "duplicate_indexes", "output_file"],
+    )
+    def test_delete_pdf_pages(
+        self, client, sample_pdf_path, out_dir, request, page_indexes, use_output_file
+    ):
+        """Test delete_pdf_pages method with various page index combinations."""
+        assert_pdf_result(
+            client.delete_pdf_pages,
+            sample_pdf_path,
+            page_indexes,
+            str(out_dir / f"{request.node.name}.pdf") if use_output_file else None,
+        )
 
     def test_delete_pdf_pages_negative_indexes_error(self, client, sample_pdf_path):
         """Test delete_pdf_pages method with negative indexes raises error."""
@@ -331,17 +323,6 @@ class TestLiveAPI:
         with pytest.raises(ValueError, match="page_indexes cannot be empty"):
             client.delete_pdf_pages(sample_pdf_path, page_indexes=[])
 
-    def test_delete_pdf_pages_duplicate_indexes(self, client, sample_pdf_path):
-        """Test delete_pdf_pages method with duplicate page indexes."""
-        # Test that duplicate indexes are handled correctly (should remove duplicates)
-        result = client.delete_pdf_pages(sample_pdf_path, page_indexes=[0, 0, 1])
-
-        assert isinstance(result, bytes)
-        assert len(result) > 0
-
-        # Verify result is a valid PDF
-        assert_is_pdf(result)
-
     @pytest.fixture
     def sample_docx_path(self):
         """Get path to sample DOCX file for testing."""
@@ -360,9 +341,9 @@ class TestLiveAPI:
         # Verify result is a valid PDF
         assert_is_pdf(result)
 
-    def test_convert_to_pdf_with_output_file(self, client, sample_docx_path, tmp_path):
+    def test_convert_to_pdf_with_output_file(self, client, sample_docx_path, out_dir, request):
         """Test convert_to_pdf method saving to output file."""
-        output_path = str(tmp_path / "converted.pdf")
+        output_path = str(out_dir / f"{request.node.name}.pdf")
 
         # Test converting and saving to file
         result = client.convert_to_pdf(sample_docx_path, output_path=output_path)
@@ -371,8 +352,8 @@ class TestLiveAPI:
         assert result is None
 
         # Check that output file was created
-        assert (tmp_path / "converted.pdf").exists()
-        assert (tmp_path / "converted.pdf").stat().st_size > 0
+        assert os.path.exists(output_path)
+        assert os.path.getsize(output_path) > 0
         assert_is_pdf(output_path)
 
     def test_convert_to_pdf_from_pdf_passthrough(self, client, sample_pdf_path):
@@ -447,9 +428,9 @@ class TestLiveAPI:
         # Verify result is a valid PDF
         assert_is_pdf(result)
 
-    def test_add_page_with_output_file(self, client, sample_pdf_path, tmp_path):
+    def test_add_page_with_output_file(self, client, sample_pdf_path, out_dir, request):
         """Test add_page method saving to output file."""
-        output_path = str(tmp_path / "with_blank_pages.pdf")
+        output_path = str(out_dir / f"{request.node.name}.pdf")
 
         # Test adding pages and saving to file
         result = client.add_page(
@@ -460,8 +441,8 @@ class TestLiveAPI:
         assert result is None
 
         # Check that output file was created
-        assert (tmp_path / "with_blank_pages.pdf").exists()
-        assert (tmp_path / "with_blank_pages.pdf").stat().st_size > 0
+        assert os.path.exists(output_path)
+        assert os.path.getsize(output_path) > 0
         assert_is_pdf(output_path)
 
     def test_add_page_different_page_sizes(self, client, sample_pdf_path):
@@ -0,0 +1,63 @@
+"""Shared fixtures for unit tests."""
+
+import copy
+from unittest.mock import create_autospec
+
+import pytest
+
+from nutrient_dws.client import NutrientClient
+from nutrient_dws.http_client import HTTPClient
+
+
+@pytest.fixture(scope="module")
+def _shared_http_client():
+    """Single HTTPClient-specced mock reused across a test module."""
+    return create_autospec(HTTPClient, instance=True)
+
+
+@pytest.fixture
+def mock_http_client(_shared_http_client):
+    """Mock HTTP client whose ``post`` returns fake PDF bytes.
+
+    The underlying mock is shared per module and reset after each test
+    instead of being rebuilt.
+    """
+    _shared_http_client.post.return_value = b"mock_pdf_bytes"
+    yield _shared_http_client
+    _shared_http_client.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def http_client():
+    """HTTPClient with a test API key shared across the session.
+
+    Tests that replace attributes must use ``monkeypatch``.
+    """
+    client = HTTPClient(api_key="test-key")
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def _client_template():
+    """NutrientClient built once per session and copied by ``client``."""
+    client = NutrientClient(api_key="test-key")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def client(_client_template):
+    """Per-test shallow copy of a shared NutrientClient.
+
+    Attributes such as ``_http_client`` can be replaced freely; the
+    template's HTTP session is shared but never mutated.
+    """
+    return copy.copy(_client_template)
+
+
+@pytest.fixture
+def env_api_key(monkeypatch):
+    """Set NUTRIENT_API_KEY for the duration of a test and return its value."""
+    monkeypatch.setenv("NUTRIENT_API_KEY", "env-key")
+    return "env-key"
@@ -1,20 +1,26 @@
 """Unit tests for Builder API."""
 
+import pytest
+
 from nutrient_dws.builder import BuildAPIWrapper
 
 
-def test_builder_init():
+@pytest.fixture
+def builder():
+    """Builder for a test input file without a client."""
+    return BuildAPIWrapper(None, "test.pdf")
+
+
+def test_builder_init(builder):
     """Test builder initialization."""
-    builder = BuildAPIWrapper(None, "test.pdf")
     assert builder._input_file == "test.pdf"
     assert builder._actions == []
     assert builder._parts == [{"file": "file"}]
     assert "file" in builder._files
 
 
-def test_builder_add_step():
+def test_builder_add_step(builder):
     """Test adding steps to builder."""
-    builder = BuildAPIWrapper(None, "test.pdf")
     result = builder.add_step("convert-to-pdf", options={"format": "docx"})
 
     assert result is builder  # Should return self for chaining
@@ -23,9 +29,8 @@ def test_builder_add_step():
     assert builder._actions[0]["format"] == "docx"
 
 
-def test_builder_chaining():
+def test_builder_chaining(builder):
     """Test method chaining."""
-    builder = BuildAPIWrapper(None, "test.pdf")
     result = (
         builder.add_step("convert-to-pdf")
         .add_step("rotate-pages", options={"degrees": 90})
@@ -38,9 +43,8 @@ def test_builder_chaining():
     assert all("type" in action for action in builder._actions)
 
 
-def test_builder_set_output_options():
+def test_builder_set_output_options(builder):
     """Test setting output options."""
-    builder = BuildAPIWrapper(None, "test.pdf")
     result = builder.set_output_options(metadata={"title": "Test Doc"}, optimize=True)
 
     assert result is builder
@@ -48,10 +52,8 @@ def test_builder_set_output_options():
     assert builder._output_options["optimize"] is True
 
 
-def test_builder_set_page_labels():
+def test_builder_set_page_labels(builder):
     """Test setting page labels."""
-    builder = BuildAPIWrapper(None, "test.pdf")
-
     labels = [
         {"pages": {"start": 0, "end": 3}, "label": "Introduction"},
         {"pages": {"start": 3, "end": 10}, "label": "Chapter 1"},
@@ -64,10 +66,8 @@ def test_builder_set_page_labels():
     assert builder._output_options["labels"] == labels
 
 
-def test_builder_set_page_labels_chaining():
+def test_builder_set_page_labels_chaining(builder):
     """Test page labels can be chained with other operations."""
-    builder = BuildAPIWrapper(None, "test.pdf")
-
     labels = [{"pages": {"start": 0, "end": 1}, "label": "Cover"}]
 
     result = (
@@ -82,11 +82,18 @@ def test_builder_set_page_labels_chaining():
     assert builder._output_options["metadata"]["title"] == "Test"
 
 
-def test_builder_execute_requires_client():
+def test_builder_execute_requires_client(builder):
     """Test that execute requires a client."""
-    builder = BuildAPIWrapper(None, "test.pdf")
     builder.add_step("convert-to-pdf")
 
     # Without a proper client, this would fail when trying to access client methods
     # We can't test the actual failure without mocking, so just ensure the method exists
     assert hasattr(builder, "execute")
+
+
+def test_builder_maps_tool_names_to_actions(builder):
+    """Test tool names and OCR languages are mapped to Build API values."""
+    builder.add_step("ocr-pdf", options={"language": "en"}).add_step("flatten-annotations")
+
+    assert builder._actions[0] == {"type": "ocr", "language": "english"}
+    assert builder._actions[1] == {"type": "flatten"}
@@ -1,9 +1,47 @@
 """Unit tests for NutrientClient."""
 
-import os
+import io
+import threading
+from typing import Any
 
+import pytest
+
+from nutrient_dws.api.direct import SPLIT_PDF_MAX_WORKERS
 from nutrient_dws.client import NutrientClient
 
+# Fake return value of prepare_file_for_upload shared by upload tests
+_FAKE_UPLOAD = ("file", ("filename.pdf", b"mock_file_data", "application/pdf"))
+
+# Direct API methods every client must expose
+_DIRECT_API_METHODS = {
+    "convert_to_pdf",
+    "flatten_annotations",
+    "rotate_pages",
+    "watermark_pdf",
+    "ocr_pdf",
+    "apply_redactions",
+    "merge_pdfs",
+    "split_pdf",
+    "duplicate_pdf_pages",
+    "delete_pdf_pages",
+    "add_page",
+    "set_page_label",
+}
+
+
+class _CallRecorder:
+    """Minimal stand-in for a function that records its calls."""
+
+    __slots__ = ("calls", "return_value")
+
+    def __init__(self, return_value: Any = None) -> None:
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self.return_value = return_value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.return_value
+
 
 def test_client_init_with_api_key():
     """Test client initialization with API key."""
@@ -12,66 +50,34 @@ def test_client_init_with_api_key():
     assert client._http_client._api_key == "test-key"
 
 
-def test_client_init_with_env_var():
-    """Test client initialization with environment variable."""
-    # Save original value
-    original = os.environ.get("NUTRIENT_API_KEY")
-
-    try:
-        os.environ["NUTRIENT_API_KEY"] = "env-key"
-        client = NutrientClient()
-        assert client._http_client._api_key == "env-key"
-    finally:
-        # Restore original value
-        if original is not None:
-            os.environ["NUTRIENT_API_KEY"] = original
-        else:
-            os.environ.pop("NUTRIENT_API_KEY", None)
-
-
-def test_client_init_precedence():
-    """Test that explicit API key takes precedence over env var."""
-    # Save original value
-    original = os.environ.get("NUTRIENT_API_KEY")
-
-    try:
-        os.environ["NUTRIENT_API_KEY"] = "env-key"
-        client = NutrientClient(api_key="explicit-key")
-        assert client._http_client._api_key == "explicit-key"
-    finally:
-        # Restore original value
-        if original is not None:
-            os.environ["NUTRIENT_API_KEY"] = original
-        else:
-            os.environ.pop("NUTRIENT_API_KEY", None)
-
-
-def test_client_build_method():
+@pytest.mark.parametrize(
+    ("api_key", "expected_key"),
+    [
+        (None, "env-key"),  # Falls back to environment variable
+        ("explicit-key", "explicit-key"),  # Explicit API key takes precedence
+    ],
+    ids=["env_var", "precedence"],
+)
+@pytest.mark.usefixtures("env_api_key")
+def test_client_init_api_key_from_env(api_key, expected_key):
+    """Test API key resolution from the NUTRIENT_API_KEY environment variable."""
+    client = NutrientClient(api_key=api_key)
+    assert client._http_client._api_key == expected_key
+
+
+def test_client_build_method(client):
     """Test that build() returns a BuildAPIWrapper."""
-    client = NutrientClient(api_key="test-key")
     builder = client.build("test.pdf")
 
     # Check class name to avoid import issues
     assert builder.__class__.__name__ == "BuildAPIWrapper"
 
 
-def test_client_has_direct_api_methods():
+def test_client_has_direct_api_methods(client):
     """Test that client has direct API methods."""
-    client = NutrientClient(api_key="test-key")
-
     # Check that direct API methods exist (from DirectAPIMixin)
-    assert hasattr(client, "convert_to_pdf")
-    assert hasattr(client, "flatten_annotations")
-    assert hasattr(client, "rotate_pages")
-    assert hasattr(client, "watermark_pdf")
-    assert hasattr(client, "ocr_pdf")
-    assert hasattr(client, "apply_redactions")
-    assert hasattr(client, "merge_pdfs")
-    assert hasattr(client, "split_pdf")
-    assert hasattr(client, "duplicate_pdf_pages")
-    assert hasattr(client, "delete_pdf_pages")
-    assert hasattr(client, "add_page")
-    assert hasattr(client, "set_page_label")
+    missing = _DIRECT_API_METHODS - set(dir(client))
+    assert not missing, f"Missing methods: {sorted(missing)}"
 
 
 def test_client_context_manager():
@@ -96,14 +102,9 @@ def test_client_close():
     client.close()
 
 
-def test_set_page_label_validation():
+def test_set_page_label_validation(client, mock_http_client):
     """Test set_page_label method validation logic."""
-    from unittest.mock import Mock
-
-    import pytest
-
-    client = NutrientClient(api_key="test-key")
-    client._http_client = Mock()  # Mock the HTTP client to avoid actual API calls
+    client._http_client = mock_http_client  # Mock the HTTP client to avoid actual API calls
 
     # Test empty labels list
     with pytest.raises(ValueError, match="labels list cannot be empty"):
@@ -134,81 +135,111 @@ def test_set_page_label_validation():
         client.set_page_label("test.pdf", [{"pages": {"end": 5}, "label": "Test"}])
 
 
-def test_set_page_label_valid_config():
+def test_set_page_label_valid_config(client, mock_http_client, monkeypatch):
     """Test set_page_label with valid configuration."""
-    from unittest.mock import Mock, patch
-
-    client = NutrientClient(api_key="test-key")
-
     # Mock HTTP client and file handler functions
-    mock_http_client = Mock()
-    mock_http_client.post.return_value = b"mock_pdf_bytes"
     client._http_client = mock_http_client
+    monkeypatch.setattr(
+        "nutrient_dws.file_handler.prepare_file_for_upload",
+        lambda *args, **kwargs: _FAKE_UPLOAD,
+    )
+    mock_save = _CallRecorder()
+    monkeypatch.setattr("nutrient_dws.file_handler.save_file_output", mock_save)
+
+    # Test valid configuration
+    labels = [
+        {"pages": {"start": 0, "end": 3}, "label": "Introduction"},
+        {"pages": {"start": 3}, "label": "Content"},
+    ]
+
+    result = client.set_page_label("test.pdf", labels)
+
+    # Expected normalized labels (implementation adds 'end': -1 when missing)
+    expected_normalized_labels = [
+        {"pages": {"start": 0, "end": 3}, "label": "Introduction"},
+        {"pages": {"start": 3, "end": -1}, "label": "Content"},
+    ]
+
+    # Verify the API call was made with correct parameters
+    mock_http_client.post.assert_called_once()
+    args, kwargs = mock_http_client.post.call_args
+    assert args == ("/build",)
+    assert kwargs["json_data"]["output"]["labels"] == expected_normalized_labels
+    assert kwargs["json_data"]["parts"] == [{"file": "file"}]
+    assert kwargs["json_data"]["actions"] == []
+    assert kwargs["files"] == {"file": _FAKE_UPLOAD[1]}
+
+    # Verify result
+    assert result == b"mock_pdf_bytes"
+
+    # Verify save_file_output was not called (no output_path)
+    assert mock_save.calls == []
+
+
+def test_set_page_label_with_output_path(client, mock_http_client, monkeypatch):
+    """Test set_page_label with output path."""
+    # Mock HTTP client and file handler functions
+    client._http_client = mock_http_client
+    monkeypatch.setattr(
+        "nutrient_dws.file_handler.prepare_file_for_upload",
+        lambda *args, **kwargs: _FAKE_UPLOAD,
+    )
+    mock_save = _CallRecorder()
+    monkeypatch.setattr("nutrient_dws.file_handler.save_file_output", mock_save)
 
-    with (
-        patch("nutrient_dws.file_handler.prepare_file_for_upload") as mock_prepare,
-        patch("nutrient_dws.file_handler.save_file_output") as mock_save,
-    ):
-        mock_prepare.return_value = ("file", ("filename.pdf", b"mock_file_data", "application/pdf"))
-
-        # Test valid configuration
-        labels = [
-            {"pages": {"start": 0, "end": 3}, "label": "Introduction"},
-            {"pages": {"start": 3}, "label": "Content"},
-        ]
+    labels = [{"pages": {"start": 0, "end": 1}, "label": "Cover"}]
 
-        result = client.set_page_label("test.pdf", labels)
+    result = client.set_page_label("test.pdf", labels, output_path="/path/to/output.pdf")
 
-        # Expected normalized labels (implementation adds 'end': -1 when missing)
-        expected_normalized_labels = [
-            {"pages": {"start": 0, "end": 3}, "label": "Introduction"},
-            {"pages": {"start": 3, "end": -1}, "label": "Content"},
-        ]
+    # Verify the API call was made
+    mock_http_client.post.assert_called_once()
 
-        # Verify the API call was made with correct parameters
-        mock_http_client.post.assert_called_once_with(
-            "/build",
-            files={"file": ("filename.pdf", b"mock_file_data", "application/pdf")},
-            json_data={
-                "parts": [{"file": "file"}],
-                "actions": [],
-                "output": {"labels": expected_normalized_labels},
-            },
-        )
+    # Verify save_file_output was called with correct parameters
+    assert mock_save.calls == [((b"mock_pdf_bytes", "/path/to/output.pdf"), {})]
 
-        # Verify result
-        assert result == b"mock_pdf_bytes"
+    # Verify result is None when output_path is provided
+    assert result is None
 
-        # Verify save_file_output was not called (no output_path)
-        mock_save.assert_not_called()
 
+def test_split_pdf_posts_one_request_per_range(client, mock_http_client):
+    """Test split_pdf sends one request per page range and keeps their order."""
+    client._http_client = mock_http_client
+    mock_http_client.post.side_effect = lambda endpoint, files, json_data: str(
+        json_data["parts"][0]["pages"]
+    ).encode()
+    page_ranges = [{"start": 0, "end": 1}, {"start": 1}]
 
-def test_set_page_label_with_output_path():
-    """Test set_page_label with output path."""
-    from unittest.mock import Mock, patch
+    result = client.split_pdf(io.BytesIO(b"%PDF-1.4"), page_ranges=page_ranges)
 
-    client = NutrientClient(api_key="test-key")
+    assert result == [str(page_range).encode() for page_range in page_ranges]
+    # File-like input is read once and the same content uploaded for every range
+    uploads = [call.kwargs["files"]["file"][1] for call in mock_http_client.post.call_args_list]
+    assert uploads == [b"%PDF-1.4", b"%PDF-1.4"]
 
-    # Mock HTTP client and file handler functions
-    mock_http_client = Mock()
-    mock_http_client.post.return_value = b"mock_pdf_bytes"
-    client._http_client = mock_http_client
 
-    with (
-        patch("nutrient_dws.file_handler.prepare_file_for_upload") as mock_prepare,
-        patch("nutrient_dws.file_handler.save_file_output") as mock_save,
-    ):
-        mock_prepare.return_value = ("file", ("filename.pdf", b"mock_file_data", "application/pdf"))
+def test_split_pdf_large_file_handles_opened_per_request(client, mock_http_client, tmp_path):
+    """Test large-file handles are opened per request and closed after it."""
+    large_pdf = tmp_path / "large.pdf"
+    with open(large_pdf, "wb") as f:
+        f.truncate(11 * 1024 * 1024)  # Sparse, above the 10MB file-handle threshold
 
-        labels = [{"pages": {"start": 0, "end": 1}, "label": "Cover"}]
+    handles: list[Any] = []
+    max_open = 0
+    lock = threading.Lock()
 
-        result = client.set_page_label("test.pdf", labels, output_path="/path/to/output.pdf")
+    def fake_post(endpoint, files, json_data):
+        nonlocal max_open
+        with lock:
+            handles.append(files["file"][1])
+            max_open = max(max_open, sum(not handle.closed for handle in handles))
+        return b"part"
 
-        # Verify the API call was made
-        mock_http_client.post.assert_called_once()
+    client._http_client = mock_http_client
+    mock_http_client.post.side_effect = fake_post
+    page_ranges = [{"start": i, "end": i + 1} for i in range(SPLIT_PDF_MAX_WORKERS * 3)]
 
-        # Verify save_file_output was called with correct parameters
-        mock_save.assert_called_once_with(b"mock_pdf_bytes", "/path/to/output.pdf")
+    client.split_pdf(str(large_pdf), page_ranges=page_ranges)
 
-        # Verify result is None when output_path is provided
-        assert result is None
+    assert len(handles) == len(page_ranges)
+    assert max_open <= SPLIT_PDF_MAX_WORKERS
+    assert all(handle.closed for handle in handles)
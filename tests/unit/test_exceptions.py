@@ -1,5 +1,7 @@
 """Unit tests for exceptions module."""
 
+import pytest
+
 from nutrient_dws.exceptions import (
     APIError,
     AuthenticationError,
@@ -9,19 +11,27 @@ from nutrient_dws.exceptions import (
     ValidationError,
 )
 
-
-def test_nutrient_error():
-    """Test base exception."""
-    exc = NutrientError("Test error")
-    assert str(exc) == "Test error"
-    assert isinstance(exc, Exception)
+_EXPECTED_FULL_CONTEXT = (
+    "Server error | Status: 500 | Request ID: req-123 | "
+    'Response: {"error": "Internal server error"}'
+)
 
 
-def test_authentication_error():
-    """Test authentication error."""
-    exc = AuthenticationError("Invalid API key")
-    assert str(exc) == "Invalid API key"
-    assert isinstance(exc, NutrientError)
+@pytest.mark.parametrize(
+    ("exc_cls", "message", "parent"),
+    [
+        (NutrientError, "Test error", Exception),
+        (AuthenticationError, "Invalid API key", NutrientError),
+        (NutrientTimeoutError, "Request timed out", NutrientError),
+        (FileProcessingError, "Failed to process file", NutrientError),
+    ],
+    ids=["nutrient", "authentication", "timeout", "file_processing"],
+)
+def test_exception_message_and_hierarchy(exc_cls, message, parent):
+    """Test simple exceptions keep their message and inherit correctly."""
+    exc = exc_cls(message)
+    assert str(exc) == message
+    assert isinstance(exc, parent)
 
 
 def test_api_error_basic():
@@ -52,9 +62,7 @@ def test_api_error_full_context():
     assert exc.status_code == 500
     assert exc.response_body == '{"error": "Internal server error"}'
     assert exc.request_id == "req-123"
-    assert "Status: 500" in str(exc)
-    assert "Request ID: req-123" in str(exc)
-    assert "Response:" in str(exc)
+    assert str(exc) == _EXPECTED_FULL_CONTEXT
 
 
 def test_validation_error():
@@ -70,17 +78,3 @@ def test_validation_error_with_details():
     errors = {"field": "Invalid value"}
     exc = ValidationError("Validation failed", errors=errors)
     assert exc.errors == errors
-
-
-def test_timeout_error():
-    """Test timeout error."""
-    exc = NutrientTimeoutError("Request timed out")
-    assert str(exc) == "Request timed out"
-    assert isinstance(exc, NutrientError)
-
-
-def test_file_processing_error():
-    """Test file processing error."""
-    exc = FileProcessingError("Failed to process file")
-    assert str(exc) == "Failed to process file"
-    assert isinstance(exc, NutrientError)
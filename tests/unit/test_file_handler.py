@@ -1,44 +1,152 @@
 """Unit tests for file handling utilities."""
 
 import io
+import re
+import shutil
+
+import pytest
 
 from nutrient_dws.file_handler import (
+    get_file_size,
+    prepare_file_for_upload,
     prepare_file_input,
+    save_file_output,
+    stream_file_content,
 )
 
+# Just above the 10MB threshold where uploads switch to file handles
+LARGE_FILE_SIZE = 11 * 1024 * 1024
+
+_UNSUPPORTED_RE = re.compile(r"Unsupported file input type")
+
+
+@pytest.fixture(scope="session")
+def fixture_files(tmp_path_factory):
+    """Read-only input files created once per session."""
+    base = tmp_path_factory.mktemp("file_handler")
+    files = {
+        "small": base / "small.pdf",
+        "large": base / "large.pdf",
+        "stream": base / "stream.txt",
+        "sized": base / "sized.bin",
+    }
+    files["small"].write_bytes(b"%PDF-1.4 small")
+    # Sparse file: no data is materialized or written for the large input
+    with open(files["large"], "wb") as f:
+        f.truncate(LARGE_FILE_SIZE)
+    files["stream"].write_bytes(b"0123456789" * 512)
+    files["sized"].write_bytes(b"X" * 1234)
+    return files
+
+
+@pytest.fixture
+def bytesio(request):
+    """BytesIO over the parametrized content, closed after the test."""
+    file_obj = io.BytesIO(request.param)
+    yield file_obj
+    file_obj.close()
 
-def test_prepare_file_input_from_bytes():
+
+@pytest.mark.parametrize(
+    "content", [b"Hello, World!", b"", b"%PDF-1.4\x00\xff"], ids=["text", "empty", "binary"]
+)
+def test_prepare_file_input_from_bytes(content):
     """Test preparing file input from bytes."""
-    content = b"Hello, World!"
     result, filename = prepare_file_input(content)
-    assert result == content
+    assert result is content
     assert filename == "document"
 
 
-def test_prepare_file_input_from_string_io():
+@pytest.mark.parametrize(
+    "bytesio",
+    [b"Test content", b"", b"%PDF-1.4\x00\xff"],
+    ids=["text", "empty", "binary"],
+    indirect=True,
+)
+def test_prepare_file_input_from_string_io(bytesio):
     """Test preparing file input from StringIO-like object."""
     # Using BytesIO instead of StringIO for binary compatibility
-    content = b"Test content"
-    file_obj = io.BytesIO(content)
-    result, filename = prepare_file_input(file_obj)
-    assert result == content
+    result, filename = prepare_file_input(bytesio)
+    assert result == bytesio.getvalue()
+    assert filename == "document"
+
+
+def test_prepare_file_input_from_text_io():
+    """Test text file-like objects are encoded to bytes."""
+    result, filename = prepare_file_input(io.StringIO("Text content"))  # type: ignore[arg-type]
+    assert result == b"Text content"
     assert filename == "document"
 
 
-def test_get_file_size_from_bytes():
-    """Test getting file size from bytes."""
-    from nutrient_dws.file_handler import get_file_size
+def test_prepare_file_input_from_path(fixture_files):
+    """Test preparing file input from str and Path file paths."""
+    path = fixture_files["small"]
+    for file_input in (str(path), path):
+        result, filename = prepare_file_input(file_input)
+        assert result == b"%PDF-1.4 small"
+        assert filename == "small.pdf"
 
-    content = b"Hello, World!"
-    size = get_file_size(content)
-    assert size == 13
 
+@pytest.mark.parametrize("prepare", [prepare_file_input, prepare_file_for_upload])
+def test_prepare_unsupported_input_type(prepare):
+    """Test unsupported input types are rejected."""
+    with pytest.raises(ValueError, match=_UNSUPPORTED_RE):
+        prepare(12345)
 
-def test_get_file_size_from_bytesio():
-    """Test getting file size from BytesIO."""
-    from nutrient_dws.file_handler import get_file_size
 
-    content = b"Test content"
-    file_obj = io.BytesIO(content)
-    size = get_file_size(file_obj)
-    assert size == 12
+def test_prepare_file_for_upload_small_file(fixture_files):
+    """Test small files are read into memory for upload."""
+    field, (filename, content, content_type) = prepare_file_for_upload(str(fixture_files["small"]))
+    assert field == "file"
+    assert filename == "small.pdf"
+    assert content == b"%PDF-1.4 small"
+    assert content_type == "application/octet-stream"
+
+
+def test_prepare_file_for_upload_large_file(fixture_files):
+    """Test large files are passed as open file handles for streaming."""
+    _, (filename, file_handle, _) = prepare_file_for_upload(str(fixture_files["large"]))
+    try:
+        assert filename == "large.pdf"
+        assert hasattr(file_handle, "read")
+    finally:
+        file_handle.close()  # type: ignore[union-attr]
+
+
+def test_save_file_output_overwrites_existing_file(fixture_files, tmp_path):
+    """Test saving output replaces an existing file's content."""
+    # Copy rather than hardlink: write_bytes truncates in place and would
+    # otherwise modify the shared session file
+    output_path = shutil.copy2(fixture_files["small"], tmp_path)
+    save_file_output(b"new content", str(output_path))
+    assert tmp_path.joinpath("small.pdf").read_bytes() == b"new content"
+    assert fixture_files["small"].read_bytes() == b"%PDF-1.4 small"
+
+
+def test_save_file_output_creates_parent_directories(tmp_path):
+    """Test saving output creates missing parent directories."""
+    output_path = tmp_path / "nested" / "dir" / "output.pdf"
+    save_file_output(b"PDF content", str(output_path))
+    assert output_path.read_bytes() == b"PDF content"
+
+
+def test_stream_file_content(fixture_files):
+    """Test streaming file content in chunks."""
+    chunks = list(stream_file_content(str(fixture_files["stream"]), chunk_size=1024))
+    assert len(chunks) == 5
+    assert b"".join(chunks) == fixture_files["stream"].read_bytes()
+
+
+@pytest.mark.parametrize(
+    ("make_input", "expected"),
+    [
+        (lambda files: b"Hello, World!", 13),
+        (lambda files: io.BytesIO(b"Test content"), 12),
+        (lambda files: str(files["sized"]), 1234),
+        (lambda files: "non_existent.pdf", None),
+    ],
+    ids=["bytes", "bytesio", "path", "missing_path"],
+)
+def test_get_file_size(fixture_files, make_input, expected):
+    """Test getting file size from the supported input types."""
+    assert get_file_size(make_input(fixture_files)) == expected
@@ -1,32 +1,56 @@
 """Unit tests for HTTPClient."""
 
-from nutrient_dws.http_client import HTTPClient
+import importlib.metadata
+import io
+import json
+from typing import Any
 
+import pytest
+import requests
+from urllib3.exceptions import ProtocolError
 
-def test_http_client_init():
-    """Test HTTP client initialization."""
-    client = HTTPClient(api_key="test-key")
-    assert client._api_key == "test-key"
-    assert client._base_url == "https://api.pspdfkit.com"
-    assert client._timeout == 300
-
+from nutrient_dws.exceptions import (
+    APIError,
+    AuthenticationError,
+    NutrientTimeoutError,
+    ValidationError,
+)
+from nutrient_dws.http_client import (
+    POOL_SIZE,
+    RETRY_BACKOFF_MAX,
+    RETRY_JITTER,
+    BackoffRetry,
+    HTTPClient,
+)
 
-def test_http_client_init_custom_timeout():
-    """Test HTTP client with custom timeout."""
-    client = HTTPClient(api_key="test-key", timeout=60)
-    assert client._timeout == 60
+BUILD_URL = "https://api.pspdfkit.com/build"
 
 
-def test_http_client_init_no_api_key():
-    """Test HTTP client initialization without API key."""
-    client = HTTPClient(api_key=None)
-    assert client._api_key is None
+@pytest.mark.parametrize(
+    ("api_key", "timeout", "expected_timeout"),
+    [("test-key", 120, 120), ("test-key", None, 300), (None, None, 300), ("", None, 300)],
+    ids=["custom_timeout", "default_timeout", "no_api_key", "empty_api_key"],
+)
+def test_http_client_init(api_key, timeout, expected_timeout):
+    """Test HTTP client initialization with and without key and timeout."""
+    kwargs = {} if timeout is None else {"timeout": timeout}
+    client = HTTPClient(api_key=api_key, **kwargs)
+    assert client._api_key == api_key
+    assert client._base_url == "https://api.pspdfkit.com"
+    assert client._timeout == expected_timeout
 
 
-def test_http_client_init_empty_api_key():
-    """Test HTTP client initialization with empty API key."""
-    client = HTTPClient(api_key="")
-    assert client._api_key == ""
+@pytest.mark.parametrize(
+    ("api_key", "authorization"),
+    [("test-key", "Bearer test-key"), (None, None)],
+    ids=["with_api_key", "without_api_key"],
+)
+def test_session_headers(api_key, authorization):
+    """Test the session sends the User-Agent and, with a key, Authorization."""
+    client = HTTPClient(api_key=api_key)
+    expected = f"nutrient-dws-python-client/{importlib.metadata.version('nutrient-dws')}"
+    assert client._session.headers["User-Agent"] == expected
+    assert client._session.headers.get("Authorization") == authorization
 
 
 def test_http_client_context_manager():
@@ -34,3 +58,239 @@ def test_http_client_context_manager():
     with HTTPClient(api_key="test-key") as client:
         assert client is not None
         assert hasattr(client, "_session")
+
+
+def test_http_client_accepts_compressed_responses():
+    """Test HTTP client negotiates compressed response bodies."""
+    client = HTTPClient(api_key="test-key")
+    assert "gzip" in client._session.headers["Accept-Encoding"]
+
+
+def test_http_client_post_many_preserves_order(http_client, monkeypatch):
+    """Test concurrent posts return results in request order."""
+    monkeypatch.setattr(http_client, "post", lambda endpoint, **kwargs: endpoint.encode())
+
+    results = http_client.post_many([{"endpoint": f"/build/{i}"} for i in range(5)])
+
+    assert results == [f"/build/{i}".encode() for i in range(5)]
+
+
+def test_http_client_post_many_rejects_output(http_client, requests_mock):
+    """Test post_many refuses to stream responses to output files."""
+    with pytest.raises(ValueError, match="does not support output"):
+        http_client.post_many([{"endpoint": "/build", "output": io.BytesIO()}])
+    assert requests_mock.call_count == 0
+
+
+def test_http_client_post_many_raises_first_error(http_client, monkeypatch):
+    """Test a failing request is raised from post_many."""
+
+    def fake_post(endpoint, **kwargs):
+        if endpoint == "/fail":
+            raise APIError("Request failed")
+        return b"ok"
+
+    monkeypatch.setattr(http_client, "post", fake_post)
+
+    with pytest.raises(APIError, match="Request failed"):
+        http_client.post_many([{"endpoint": "/ok"}, {"endpoint": "/fail"}])
+
+
+def test_post_success(http_client, requests_mock):
+    """Test successful POST returns the response content."""
+    requests_mock.post(BUILD_URL, content=b"Success response")
+
+    assert http_client.post("/build") == b"Success response"
+    assert requests_mock.last_request.headers["Authorization"] == "Bearer test-key"
+
+
+def test_post_streams_to_output(http_client, requests_mock):
+    """Test POST writes the response content to the output file object."""
+    requests_mock.post(BUILD_URL, content=b"Success response")
+    output = io.BytesIO()
+
+    assert http_client.post("/build", output=output) is None
+    assert output.getvalue() == b"Success response"
+
+
+def test_post_with_files_and_json_data(http_client, requests_mock):
+    """Test files and instructions are sent as multipart form parts."""
+    requests_mock.post(BUILD_URL, content=b"PDF result")
+
+    result = http_client.post(
+        "/build",
+        files={"file": ("test.pdf", b"PDF content", "application/pdf")},
+        json_data={"parts": [{"file": "file"}], "actions": []},
+    )
+
+    assert result == b"PDF result"
+    body = requests_mock.last_request.body
+    assert b'name="file"; filename="test.pdf"' in body
+    assert b"PDF content" in body
+    assert b'name="instructions"' in body
+    assert b'{"parts":[{"file":"file"}],"actions":[]}' in body
+
+
+def test_post_without_api_key(requests_mock):
+    """Test POST without API key fails before sending a request."""
+    client = HTTPClient(api_key=None)
+
+    with pytest.raises(AuthenticationError, match="API key is required"):
+        client.post("/build")
+    assert requests_mock.call_count == 0
+
+
+@pytest.mark.parametrize("status_code", [401, 403])
+def test_post_authentication_error(http_client, requests_mock, status_code):
+    """Test 401/403 responses raise AuthenticationError."""
+    requests_mock.post(BUILD_URL, status_code=status_code, json={"message": "Invalid API key"})
+
+    with pytest.raises(AuthenticationError, match="Invalid API key"):
+        http_client.post("/build")
+
+
+def test_post_validation_error(http_client, requests_mock):
+    """Test 422 responses raise ValidationError with details."""
+    requests_mock.post(
+        BUILD_URL,
+        status_code=422,
+        json={"message": "Invalid parameters", "errors": {"field": "required"}},
+    )
+
+    with pytest.raises(ValidationError, match="Invalid parameters") as exc_info:
+        http_client.post("/build")
+    assert exc_info.value.errors == {"field": "required"}
+
+
+def test_post_api_error_with_json(http_client, requests_mock):
+    """Test error responses with a JSON body raise APIError with context."""
+    requests_mock.post(
+        BUILD_URL,
+        status_code=400,
+        json={"message": "Bad request"},
+        headers={"X-Request-Id": "req-123"},
+    )
+
+    with pytest.raises(APIError, match="Bad request") as exc_info:
+        http_client.post("/build")
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.request_id == "req-123"
+
+
+def test_post_api_error_with_text(http_client, requests_mock):
+    """Test error responses with a text body include the text in the message."""
+    requests_mock.post(BUILD_URL, status_code=400, text="Something went wrong")
+
+    with pytest.raises(APIError, match="HTTP 400: Something went wrong") as exc_info:
+        http_client.post("/build")
+    assert exc_info.value.response_body == "Something went wrong"
+
+
+class _FailingBody(io.RawIOBase):
+    """Response body that yields one chunk and then raises ``error``."""
+
+    def __init__(self, error: Exception) -> None:
+        self._error = error
+        self._sent = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._sent:
+            raise self._error
+        self._sent = True
+        buffer[:5] = b"%PDF-"
+        return 5
+
+
+@pytest.mark.parametrize("stream_to_output", [False, True], ids=["bytes", "output"])
+@pytest.mark.parametrize(
+    ("error", "expected", "match"),
+    [
+        (TimeoutError("read timed out"), APIError, "Connection error"),
+        (ProtocolError("connection broken"), APIError, "Request failed"),
+    ],
+    ids=["read_timeout", "broken_chunked_body"],
+)
+def test_post_body_read_failure(
+    http_client, requests_mock, error, expected, match, stream_to_output
+):
+    """Test failures while streaming the body are wrapped in client exceptions."""
+    requests_mock.post(BUILD_URL, body=_FailingBody(error))
+    output = io.BytesIO() if stream_to_output else None
+
+    with pytest.raises(expected, match=match):
+        http_client.post("/build", output=output)
+
+
+@pytest.mark.parametrize("decoder", ["json", "orjson"])
+@pytest.mark.parametrize(
+    ("body", "expected_message"),
+    [
+        (b'{"message": "Bad request"}', "Bad request"),
+        (b"Something went wrong", "HTTP 400: Something went wrong"),
+    ],
+    ids=["json_body", "text_body"],
+)
+def test_post_error_parsing_decoders(
+    http_client, requests_mock, monkeypatch, decoder, body, expected_message
+):
+    """Test error bodies are parsed, or fall back to text, with either decoder."""
+    # orjson is an optional extra; only its cases are skipped when it is missing
+    loads = json.loads if decoder == "json" else pytest.importorskip("orjson").loads
+    monkeypatch.setattr("nutrient_dws.http_client._json_loads", loads)
+    requests_mock.post(BUILD_URL, status_code=400, content=body)
+
+    with pytest.raises(APIError) as exc_info:
+        http_client.post("/build")
+    assert exc_info.value.args[0] == expected_message
+
+
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (requests.exceptions.Timeout, NutrientTimeoutError),
+        (requests.exceptions.ConnectionError, APIError),
+    ],
+    ids=["timeout", "connection_error"],
+)
+def test_post_request_exceptions(http_client, requests_mock, exc, expected):
+    """Test transport failures are wrapped in client exceptions."""
+    requests_mock.post(BUILD_URL, exc=exc)
+
+    with pytest.raises(expected):
+        http_client.post("/build")
+
+
+@pytest.mark.parametrize(
+    ("errors", "base_delay"),
+    [(1, 0), (2, 2), (3, 4), (6, 32)],
+    ids=["first_retry", "second", "third", "capped"],
+)
+def test_backoff_retry_jittered_and_capped(errors, base_delay):
+    """Test retry backoff adds bounded jitter and never exceeds the cap."""
+    retry = BackoffRetry(total=10, backoff_factor=1)
+    for _ in range(errors):
+        retry = retry.increment(method="POST", url="/build")
+
+    backoff = retry.get_backoff_time()
+
+    assert backoff <= RETRY_BACKOFF_MAX
+    assert min(base_delay, RETRY_BACKOFF_MAX) <= backoff
+    assert backoff <= base_delay * (1 + RETRY_JITTER)
+
+
+def test_http_client_retry_policy(http_client):
+    """Test the session retries transient statuses with backoff."""
+    retry = http_client._session.get_adapter(BUILD_URL).max_retries
+    assert isinstance(retry, BackoffRetry)
+    assert set(retry.status_forcelist) == {408, 429, 500, 502, 503, 504}
+
+
+def test_http_client_connection_pool(http_client):
+    """Test both schemes share a blocking pool sized for concurrent requests."""
+    adapter = http_client._session.get_adapter(BUILD_URL)
+    assert http_client._session.get_adapter("http://api.pspdfkit.com") is adapter
+    assert adapter._pool_maxsize == POOL_SIZE
+    assert adapter._pool_block is True